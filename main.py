@@ -1,156 +1,471 @@
 from __future__ import annotations
 
+import gzip
+import hashlib
+import itertools
 import os
 import socket
-from datetime import datetime
+from collections import defaultdict
+from datetime import date, datetime, timezone
 
-from typing import Dict, List
+from typing import Any, Dict, List
 
-from fastapi import FastAPI, HTTPException
-from fastapi import Query, Path
+from fastapi import FastAPI, HTTPException, Response
+from fastapi import Header, Query, Path
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from typing import Optional
 
-from models.owner import OwnerCreate, OwnerRead
-from models.company import CompanyCreate, CompanyRead
+from pydantic import BaseModel, TypeAdapter
+
+from middleware.request_logging import RequestLoggingMiddleware
+from models.owner import OwnerCreate, OwnerRead, OwnerUpdate
+from models.company import CompanyCreate, CompanyRead, CompanyUpdate
 
 port = int(os.environ.get("FASTAPIPORT", 8000))
+# ENV=prod turns off the interactive docs and the OpenAPI schema endpoint.
+is_prod = os.environ.get("ENV") == "prod"
+
+# Shared by GZipMiddleware and the pre-compressed list cache.
+GZIP_MINIMUM_SIZE = 1000
+GZIP_COMPRESSLEVEL = 5
 
 # -----------------------------------------------------------------------------
 # Fake in-memory "databases"
 # -----------------------------------------------------------------------------
 
-owners: Dict[int, OwnerRead] = {}
-companies: Dict[int, CompanyRead] = {}
+# Insertion-ordered key set (dict keys, values unused). Every index bucket and
+# column is kept as a subsequence of the rows order, so filtered results come
+# back in the same order as the unfiltered list.
+Keys = Dict[int, None]
+
+
+def _index_add(
+    index: Dict[str, Keys],
+    value: Optional[str],
+    key: int,
+    order: Dict[int, int],
+) -> None:
+    """Add key to the bucket for value, keeping the bucket in rows order.
+
+    order maps key -> insertion sequence. New keys have the highest sequence and
+    are simply appended; a key moved here by an update is put back in place.
+    """
+    if value is None:
+        return
+    keys = index[value]
+    if key in keys:
+        return
+    last = next(reversed(keys), None)
+    if last is not None and order[last] > order[key]:
+        index[value] = dict.fromkeys(sorted([*keys, key], key=order.__getitem__))
+    else:
+        keys[key] = None
+
+
+def _index_move(
+    index: Dict[str, Keys],
+    old: Optional[str],
+    new: Optional[str],
+    key: int,
+    order: Dict[int, int],
+) -> None:
+    if old != new:
+        _index_remove(index, old, key)
+        _index_add(index, new, key, order)
+
+
+def _index_remove(index: Dict[str, Keys], value: Optional[str], key: int) -> None:
+    keys = index.get(value)
+    if keys is not None:
+        keys.pop(key, None)
+        if not keys:
+            del index[value]
+
+
+def _index_lookup(
+    candidates: Optional[Keys],
+    index: Dict[str, Keys],
+    value: Optional[str],
+) -> Optional[Keys]:
+    """Intersect candidates with the index hits for value; None means no filter yet."""
+    if value is None or candidates == {}:
+        return candidates
+    hits = index.get(value, {})
+    if candidates is None:
+        return dict(hits)
+    # Walk the smaller side; both are in rows order, so the result is as well.
+    small, large = (candidates, hits) if len(candidates) <= len(hits) else (hits, candidates)
+    return {key: None for key in small if key in large}
+
+
+def _column_match(
+    candidates: Optional[Keys],
+    column: Dict[int, Any],
+    value: Any,
+) -> Optional[Keys]:
+    """Keep the keys whose column value equals value, scanning only that column.
+
+    value must already have the column's type (parse query params once, e.g. as
+    date); never convert per row with str()/int() inside the scan.
+    """
+    # Once an earlier filter has matched nothing there is nothing left to scan.
+    if value is None or candidates == {}:
+        return candidates
+    if candidates is None:
+        return {key: None for key, v in column.items() if v == value}
+    return {key: None for key in candidates if column[key] == value}
+
+
+def _model_response(model: BaseModel, status_code: int = 200) -> Response:
+    """Serialize a stored record straight to JSON bytes (no re-validation, no jsonable_encoder)."""
+    return Response(content=model.model_dump_json(), media_type="application/json", status_code=status_code)
+
+
+def _etag(body: bytes) -> str:
+    # Weak: the same tag goes out on both the gzip-encoded and identity bodies.
+    return 'W/"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def _opaque_tag(tag: str) -> str:
+    """Strip the weak prefix so tags compare weakly (RFC 9110 section 8.8.3.2)."""
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+class ListCache:
+    """Serialized unfiltered list: identity body, its gzip encoding and weak ETag.
+
+    The gzip body is built on the first gzip-capable request and reused, so
+    GZipMiddleware does not recompress the same bytes on every hit.
+    """
+
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+        self.etag = _etag(body)
+        self._gzip_body: Optional[bytes] = None
+
+    def gzip_body(self) -> bytes:
+        if self._gzip_body is None:
+            self._gzip_body = gzip.compress(self.body, compresslevel=GZIP_COMPRESSLEVEL, mtime=0)
+        return self._gzip_body
+
+
+def _cached_list_response(
+    cache: ListCache,
+    if_none_match: Optional[str],
+    accept_encoding: Optional[str],
+) -> Response:
+    """Serve a cached list body, or 304 if the client already has this version."""
+    if if_none_match is not None:
+        tags = {_opaque_tag(tag) for tag in if_none_match.split(",")}
+        if _opaque_tag(cache.etag) in tags or "*" in tags:
+            return Response(status_code=304, headers={"ETag": cache.etag, "Vary": "Accept-Encoding"})
+    # Same negotiation as GZipMiddleware, which passes an already-encoded body
+    # through untouched (and adds Vary itself to large identity bodies).
+    if "gzip" in (accept_encoding or "") and len(cache.body) >= GZIP_MINIMUM_SIZE:
+        headers = {"ETag": cache.etag, "Vary": "Accept-Encoding", "Content-Encoding": "gzip"}
+        return Response(content=cache.gzip_body(), media_type="application/json", headers=headers)
+    return Response(content=cache.body, media_type="application/json", headers={"ETag": cache.etag})
+
+
+class CompanyTable:
+    """Companies by EIN, plus per-field columns and indexes used by list filters.
+
+    Filters read the column dicts (EIN -> value) instead of whole CompanyRead
+    objects; city/state are equality indexes (value -> EINs). list_cache holds
+    the serialized unfiltered list (a ListCache) and is dropped on every write.
+    """
+
+    def __init__(self) -> None:
+        self.rows: Dict[int, CompanyRead] = {}
+        self.order: Dict[int, int] = {}
+        self._seq = itertools.count()
+        self.list_cache: Optional[ListCache] = None
+        self.name: Dict[int, str] = {}
+        self.street: Dict[int, str] = {}
+        self.postal_code: Dict[int, Optional[str]] = {}
+        self.by_city: Dict[str, Keys] = defaultdict(dict)
+        self.by_state: Dict[str, Keys] = defaultdict(dict)
+
+    def insert(self, company: CompanyRead) -> None:
+        """Add a company, or replace it in place (keeping its position) if the EIN exists."""
+        ein = company.EIN
+        self.list_cache = None
+        old = self.rows.get(ein)
+        if old is None:
+            self.order[ein] = next(self._seq)
+        self.rows[ein] = company
+        self.name[ein] = company.name
+        self.street[ein] = company.street
+        self.postal_code[ein] = company.postal_code
+        _index_move(self.by_city, old.city if old else None, company.city, ein, self.order)
+        _index_move(self.by_state, old.state if old else None, company.state, ein, self.order)
+
+    def delete(self, ein: int) -> CompanyRead:
+        company = self.rows.pop(ein)
+        del self.order[ein]
+        self.list_cache = None
+        del self.name[ein]
+        del self.street[ein]
+        del self.postal_code[ein]
+        _index_remove(self.by_city, company.city, ein)
+        _index_remove(self.by_state, company.state, ein)
+        return company
+
+
+class OwnerTable:
+    """Owners by SSN, plus per-field columns and indexes used by list filters.
+
+    first_name/last_name/email/city are equality indexes (value -> SSNs; city
+    covers every linked company). phone/birth_date are columns (SSN -> value).
+    list_cache holds the serialized unfiltered list (a ListCache) and is
+    dropped on every write.
+    """
+
+    def __init__(self) -> None:
+        self.rows: Dict[int, OwnerRead] = {}
+        self.order: Dict[int, int] = {}
+        self._seq = itertools.count()
+        self.list_cache: Optional[ListCache] = None
+        self.phone: Dict[int, Optional[str]] = {}
+        self.birth_date: Dict[int, Optional[date]] = {}
+        self.by_first_name: Dict[str, Keys] = defaultdict(dict)
+        self.by_last_name: Dict[str, Keys] = defaultdict(dict)
+        self.by_email: Dict[str, Keys] = defaultdict(dict)
+        self.by_city: Dict[str, Keys] = defaultdict(dict)
+
+    def insert(self, owner: OwnerRead) -> None:
+        """Add an owner, or replace it in place (keeping its position) if the SSN exists."""
+        ssn = owner.ssn
+        self.list_cache = None
+        old = self.rows.get(ssn)
+        if old is None:
+            self.order[ssn] = next(self._seq)
+        self.rows[ssn] = owner
+        self.phone[ssn] = owner.phone
+        self.birth_date[ssn] = owner.birth_date
+        _index_move(self.by_first_name, old.first_name if old else None, owner.first_name, ssn, self.order)
+        _index_move(self.by_last_name, old.last_name if old else None, owner.last_name, ssn, self.order)
+        _index_move(self.by_email, old.email if old else None, owner.email, ssn, self.order)
+        old_cities = {company.city for company in old.Companies} if old else set()
+        new_cities = {company.city for company in owner.Companies}
+        for city in old_cities - new_cities:
+            _index_remove(self.by_city, city, ssn)
+        for city in new_cities - old_cities:
+            _index_add(self.by_city, city, ssn, self.order)
+
+    def delete(self, ssn: int) -> OwnerRead:
+        owner = self.rows.pop(ssn)
+        del self.order[ssn]
+        self.list_cache = None
+        del self.phone[ssn]
+        del self.birth_date[ssn]
+        _index_remove(self.by_first_name, owner.first_name, ssn)
+        _index_remove(self.by_last_name, owner.last_name, ssn)
+        _index_remove(self.by_email, owner.email, ssn)
+        for company in owner.Companies:
+            _index_remove(self.by_city, company.city, ssn)
+        return owner
+
+
+owners = OwnerTable()
+companies = CompanyTable()
+
+# Built once and reused: dump_json serializes a whole list to JSON bytes in one pass.
+owners_adapter = TypeAdapter(List[OwnerRead])
+companies_adapter = TypeAdapter(List[CompanyRead])
 
 app = FastAPI(
     title="Owner/Company API",
     description="Demo FastAPI app using Pydantic v2 models for Owner and Company",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
+    docs_url=None if is_prod else "/docs",
+    redoc_url=None if is_prod else "/redoc",
+    openapi_url=None if is_prod else "/openapi.json",
 )
 
+# Compress large (list) responses; small replies stay under minimum_size and go out as-is.
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE, compresslevel=GZIP_COMPRESSLEVEL)
+# Middleware must be pure ASGI classes (see middleware/), not BaseHTTPMiddleware.
+app.add_middleware(RequestLoggingMiddleware)
+
+# Handlers serialize the CompanyRead/OwnerRead instances we already built and
+# validated ourselves and return a ready-made Response. FastAPI neither
+# re-validates nor re-encodes a Response, so response_model only documents the
+# shape in the OpenAPI schema.
+# They are also `async def`: they only touch in-memory dicts, so running them on
+# the event loop avoids the threadpool hop. Blocking calls must not be added here.
+
 # -----------------------------------------------------------------------------
 # Address endpoints
 # -----------------------------------------------------------------------------
 
 @app.post("/companies", response_model=CompanyRead, status_code=201)
-def create_company(company: CompanyCreate):
-    if company.EIN in companies:
+async def create_company(company: CompanyCreate) -> Response:
+    if company.EIN in companies.rows:
         raise HTTPException(status_code=400, detail="Company with this EIN already exists")
-    companies[company.EIN] = CompanyRead(**company.model_dump())
-    return companies[company.EIN]
+    # The body was already validated by FastAPI; build the stored record without re-validating.
+    now = datetime.now(timezone.utc)
+    company_read = CompanyRead.model_construct(**company.__dict__, created_at=now, updated_at=now)
+    companies.insert(company_read)
+    return _model_response(company_read, status_code=201)
 
 @app.get("/companies", response_model=List[CompanyRead])
-def list_companies(
+async def list_companies(
     name: Optional[str] = Query(None, description="Filter by name"),
     street: Optional[str] = Query(None, description="Filter by street"),
     city: Optional[str] = Query(None, description="Filter by city"),
     state: Optional[str] = Query(None, description="Filter by state/region"),
     postal_code: Optional[str] = Query(None, description="Filter by postal code"),
-):
-    results = list(companies.values())
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+) -> Response:
+    # The unfiltered list is served from cached bytes until the next write.
+    filters = (name, street, city, state, postal_code)
+    if all(f is None for f in filters):
+        if companies.list_cache is None:
+            companies.list_cache = ListCache(companies_adapter.dump_json(list(companies.rows.values())))
+        return _cached_list_response(companies.list_cache, if_none_match, accept_encoding)
 
-    if name is not None:
-        results = [a for a in results if a.name == name]
-    if street is not None:
-        results = [a for a in results if a.street == street]
-    if city is not None:
-        results = [a for a in results if a.city == city]
-    if state is not None:
-        results = [a for a in results if a.state == state]
-    if postal_code is not None:
-        results = [a for a in results if a.postal_code == postal_code]
+    # Narrow the candidate EINs through the indexes, then the column scans.
+    candidates = _index_lookup(None, companies.by_city, city)
+    candidates = _index_lookup(candidates, companies.by_state, state)
+    candidates = _column_match(candidates, companies.name, name)
+    candidates = _column_match(candidates, companies.street, street)
+    candidates = _column_match(candidates, companies.postal_code, postal_code)
 
-
-    return results
+    results = [companies.rows[ein] for ein in candidates]
+    return Response(content=companies_adapter.dump_json(results), media_type="application/json")
 
 @app.get("/companies/{company_ein}", response_model=CompanyRead)
-def get_company(company_ein: int):
-    if company_ein not in companies:
+async def get_company(company_ein: int) -> Response:
+    if company_ein not in companies.rows:
         raise HTTPException(status_code=404, detail="Company not found")
-    return companies[company_ein]
+    return _model_response(companies.rows[company_ein])
 
 @app.put("/companies/{company_ein}", response_model=CompanyRead)
-def update_company(company_ein: int):
-    company = CompanyCreate(company_ein)
-    companies[company_ein] = CompanyRead(**company.model_dump())
-    return companies[company_ein]
-
-@app.delete("/companies/{company_ein}", response_model=OwnerRead)
-def delete_company(company_ein: int):
-    if company_ein not in companies:
+async def update_company(company_ein: int, company: CompanyUpdate) -> Response:
+    existing = companies.rows.get(company_ein)
+    if existing is None:
+        raise HTTPException(status_code=404, detail="Company not found")
+    # Copy only the fields the client sent (kept as validated values, not re-dumped).
+    changes = {field: getattr(company, field) for field in company.model_fields_set}
+    changes["updated_at"] = datetime.now(timezone.utc)
+    updated = existing.model_copy(update=changes)
+    companies.insert(updated)
+    return _model_response(updated)
+
+@app.delete("/companies/{company_ein}", response_model=None, status_code=204, response_class=Response)
+async def delete_company(company_ein: int) -> None:
+    if company_ein not in companies.rows:
         raise HTTPException(status_code=404, detail="Company not found")
-    del companies[company_ein]
+    companies.delete(company_ein)
 # -----------------------------------------------------------------------------
 # Person endpoints
 # -----------------------------------------------------------------------------
 @app.post("/owner", response_model=OwnerRead, status_code=201)
-def create_owner(owner: OwnerCreate):
+async def create_owner(owner: OwnerCreate) -> Response:
     # Each owner gets its own UUID; stored as OwnerRead
-    owner_read = OwnerRead(**owner.model_dump())
-    owners[owner_read.ssn] = owner_read
-    return owner_read
+    # The body was already validated by FastAPI; build the stored record without re-validating.
+    now = datetime.now(timezone.utc)
+    owner_read = OwnerRead.model_construct(**owner.__dict__, created_at=now, updated_at=now)
+    owners.insert(owner_read)
+    return _model_response(owner_read, status_code=201)
 
 @app.get("/owners", response_model=List[OwnerRead])
-def list_owners(
-    ssn: Optional[str] = Query(None, description="Filter by ssn"),
+async def list_owners(
+    ssn: Optional[int] = Query(None, description="Filter by ssn"),
     first_name: Optional[str] = Query(None, description="Filter by first name"),
     last_name: Optional[str] = Query(None, description="Filter by last name"),
     email: Optional[str] = Query(None, description="Filter by email"),
     phone: Optional[str] = Query(None, description="Filter by phone number"),
-    birth_date: Optional[str] = Query(None, description="Filter by date of birth (YYYY-MM-DD)"),
+    birth_date: Optional[date] = Query(None, description="Filter by date of birth (YYYY-MM-DD)"),
     city: Optional[str] = Query(None, description="Filter by city of at least one address"),
-):
-    results = list(owners.values())
+    if_none_match: Optional[str] = Header(None),
+    accept_encoding: Optional[str] = Header(None),
+) -> Response:
+    # The unfiltered list is served from cached bytes until the next write.
+    filters = (ssn, first_name, last_name, email, phone, birth_date, city)
+    if all(f is None for f in filters):
+        if owners.list_cache is None:
+            owners.list_cache = ListCache(owners_adapter.dump_json(list(owners.rows.values())))
+        return _cached_list_response(owners.list_cache, if_none_match, accept_encoding)
 
+    # SSN is the primary key, so it is a direct lookup rather than a scan.
+    candidates = None
     if ssn is not None:
-        results = [p for p in results if p.ssn == ssn]
-    if first_name is not None:
-        results = [p for p in results if p.first_name == first_name]
-    if last_name is not None:
-        results = [p for p in results if p.last_name == last_name]
-    if email is not None:
-        results = [p for p in results if p.email == email]
-    if phone is not None:
-        results = [p for p in results if p.phone == phone]
-    if birth_date is not None:
-        results = [p for p in results if str(p.birth_date) == birth_date]
-
-    # nested address filtering
-    if city is not None:
-        results = [p for p in results if any(addr.city == city for addr in p.Companies)]
-
-    return results
-
-@app.get("/owners/{owner_ein}", response_model=OwnerRead)
-def get_owner(owner_ssn: int):
-    if owner_ssn not in owners:
+        candidates = {ssn: None} if ssn in owners.rows else {}
+
+    # Narrow the candidate SSNs through the indexes, then the column scans
+    # (city matches if at least one linked company is in it).
+    candidates = _index_lookup(candidates, owners.by_first_name, first_name)
+    candidates = _index_lookup(candidates, owners.by_last_name, last_name)
+    candidates = _index_lookup(candidates, owners.by_email, email)
+    candidates = _index_lookup(candidates, owners.by_city, city)
+    candidates = _column_match(candidates, owners.phone, phone)
+    candidates = _column_match(candidates, owners.birth_date, birth_date)
+
+    results = [owners.rows[s] for s in candidates]
+    return Response(content=owners_adapter.dump_json(results), media_type="application/json")
+
+@app.get("/owners/{owner_ssn}", response_model=OwnerRead)
+async def get_owner(owner_ssn: int) -> Response:
+    if owner_ssn not in owners.rows:
         raise HTTPException(status_code=404, detail="Owner not found")
-    return owners[owner_ssn]
+    return _model_response(owners.rows[owner_ssn])
 
-@app.put("/owners/{owner_ein}", response_model=OwnerRead)
-def update_owner(owner_ssn: int):
-    owner = OwnerCreate(owner_ssn)
-    owners[owner_ssn] = OwnerRead(**owner.model_dump())
-    return owners[owner_ssn]
+@app.put("/owners/{owner_ssn}", response_model=OwnerRead)
+async def update_owner(owner_ssn: int, owner: OwnerUpdate) -> Response:
+    existing = owners.rows.get(owner_ssn)
+    if existing is None:
+        raise HTTPException(status_code=404, detail="Owner not found")
+    # Copy only the fields the client sent (kept as validated values, not re-dumped).
+    changes = {field: getattr(owner, field) for field in owner.model_fields_set}
+    changes["updated_at"] = datetime.now(timezone.utc)
+    updated = existing.model_copy(update=changes)
+    owners.insert(updated)
+    return _model_response(updated)
 
-@app.delete("/owners/{owner_ssn}", response_model=OwnerRead)
-def delete_owner(owner_ssn: int):
-    if owner_ssn not in owners:
+@app.delete("/owners/{owner_ssn}", response_model=None, status_code=204, response_class=Response)
+async def delete_owner(owner_ssn: int) -> None:
+    if owner_ssn not in owners.rows:
         raise HTTPException(status_code=404, detail="Owner not found")
-    del owners[owner_ssn]
+    owners.delete(owner_ssn)
     
 
 # -----------------------------------------------------------------------------
 # Root
 # -----------------------------------------------------------------------------
 @app.get("/")
-def root():
+async def root():
     return {"message": "Welcome to the Owner/Company API. See /docs for OpenAPI UI."}
 
+# Build the OpenAPI schema once at import (it is memoized in app.openapi_schema)
+# so the first /docs request does not pay for walking every route and model.
+if app.openapi_url:
+    app.openapi()
+
 # -----------------------------------------------------------------------------
 # Entrypoint for `python main.py`
 # -----------------------------------------------------------------------------
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("main:app", host="0.0.0.0", port=port, reload=True)
+    # uvloop + httptools replace the default asyncio loop and h11 parser.
+    # RELOAD=1 is for development only (single process, file watcher).
+    # Each worker is a separate process with its own in-memory "databases",
+    # so keep the default WORKERS=1; raise it only once storage is external.
+    reload = os.environ.get("RELOAD", "0") == "1"
+    workers = int(os.environ.get("WORKERS", 1))
+
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=port,
+        loop="uvloop",
+        http="httptools",
+        reload=reload,
+        workers=None if reload else workers,
+    )
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import logging
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+class RequestLoggingMiddleware:
+    """Log method, path, status and duration of each HTTP request.
+
+    Written as plain ASGI middleware rather than BaseHTTPMiddleware so no
+    intermediate Request/Response objects or extra task are created per call;
+    new middleware (auth, etc.) should follow the same pattern.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not logger.isEnabledFor(logging.INFO):
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            logger.info(
+                "%s %s %d %.2fms",
+                scope["method"],
+                scope["path"],
+                status_code,
+                (time.perf_counter() - start) * 1000,
+            )
@@ -1,56 +1,20 @@
-from __future__ import annotations
-
 from typing import Optional
 from uuid import UUID, uuid4
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
+
+from .fields import reject_null
 
 
 class CompanyBase(BaseModel):
-    EIN: int = Field(
-        description="Employer Identification Number",
-        json_schema_extra={"example": "923345678"},
-    )
-    name: str = Field(
-        ...,
-        description="Company Name.",
-        json_schema_extra={"example": "Lucky Deli"},
-    )
-    street: str = Field(
-        ...,
-        description="Street address and number.",
-        json_schema_extra={"example": "117 Broadway"},
-    )
-    city: str = Field(
-        ...,
-        description="City or locality.",
-        json_schema_extra={"example": "New York"},
-    )
-    state: Optional[str] = Field(
-        None,
-        description="State/region code if applicable.",
-        json_schema_extra={"example": "NY"},
-    )
-    postal_code: Optional[str] = Field(
-        None,
-        description="Postal or ZIP code.",
-        json_schema_extra={"example": "10027"},
-    )
+    EIN: int = Field(description="Employer Identification Number")
+    name: str = Field(..., description="Company Name.")
+    street: str = Field(..., description="Street address and number.")
+    city: str = Field(..., description="City or locality.")
+    state: Optional[str] = Field(None, description="State/region code if applicable.")
+    postal_code: Optional[str] = Field(None, description="Postal or ZIP code.")
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "ein": "923345678",
-                    "name": "Lucky Deli",
-                    "street": "117 Broadway",
-                    "city": "New York",
-                    "state": "NY",
-                    "postal_code": "10027",
-                }
-            ]
-        }
-    }
+    model_config = {}
 
 
 class CompanyCreate(CompanyBase):
@@ -71,6 +35,17 @@ class CompanyCreate(CompanyBase):
     }
 
 
+class CompanyUpdate(BaseModel):
+    """Partial update; company EIN is taken from the path, not the body."""
+    name: Optional[str] = Field(None, description="Company Name.")
+    street: Optional[str] = Field(None, description="Street address and number.")
+    city: Optional[str] = Field(None, description="City or locality.")
+    state: Optional[str] = Field(None, description="State/region code if applicable.")
+    postal_code: Optional[str] = Field(None, description="Postal or ZIP code.")
+
+    # Required on the stored record, so an explicit null is rejected.
+    _not_null = field_validator("name", "street", "city")(reject_null)
+
     model_config = {
         "json_schema_extra": {
             "examples": [
@@ -87,16 +62,8 @@ class CompanyCreate(CompanyBase):
 
 
 class CompanyRead(CompanyBase):
-    created_at: datetime = Field(
-        default_factory=datetime.utcnow,
-        description="Creation timestamp (UTC).",
-        json_schema_extra={"example": "2025-01-15T10:20:30Z"},
-    )
-    updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
-        description="Last update timestamp (UTC).",
-        json_schema_extra={"example": "2025-01-16T12:00:00Z"},
-    )
+    created_at: datetime = Field(..., description="Creation timestamp (UTC).")
+    updated_at: datetime = Field(..., description="Last update timestamp (UTC).")
 
     model_config = {
         "json_schema_extra": {
@@ -0,0 +1,14 @@
+from typing import Annotated, Any
+
+from pydantic import StringConstraints
+
+# Email: lightweight shape check (local@domain.tld) instead of EmailStr's full RFC parse
+EMAIL_RE = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+EmailType = Annotated[str, StringConstraints(pattern=EMAIL_RE)]
+
+
+def reject_null(value: Any) -> Any:
+    """field_validator for partial updates: a field may be omitted but not sent as null."""
+    if value is None:
+        raise ValueError("may be omitted but cannot be null")
+    return value